@@ -5,11 +5,16 @@ import yaml
 import sys
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def parse_blueprint(path: str = "blueprint.yaml") -> dict:
     """Parse a blueprint YAML file and return the parsed structure."""
     with open(path) as f:
-        blueprint = yaml.safe_load(f)
+        blueprint = yaml.load(f, Loader=_Loader)
     return blueprint
 
 
@@ -34,32 +34,44 @@ def format_time(seconds_left):
 
 def countdown(minutes):
     total = int(minutes * 60)
+    # Tick against an absolute deadline so per-tick work doesn't add up to drift
+    deadline = time.monotonic() + total
+    prev_color = None
     try:
-        for remaining in range(total, -1, -1):
+        while True:
+            remaining = max(0, round(deadline - time.monotonic()))
             display = format_time(remaining)
-            if remaining < 300:  # less than 5 minutes
-                line = f"\r{RED}{display}{RESET} "
+            color = RED if remaining < 300 else ""  # less than 5 minutes
+            if color != prev_color:
+                # Color stays set until the final RESET, so only send it on change
+                line = f"\r{color}{display} "
+                prev_color = color
             else:
                 line = f"\r{display} "
             sys.stdout.write(line)
             sys.stdout.flush()
-            if remaining > 0:
-                time.sleep(1)
+            if remaining == 0:
+                break
+            time.sleep(max(0, deadline - time.monotonic() - (remaining - 1)))
     except KeyboardInterrupt:
         sys.stdout.write(RESET + "\n")
         print("Cancelled.")
         sys.exit(0)
 
-    # Flash screen 5 times on completion
-    sys.stdout.write("\n")
-    for _ in range(5):
+    # Flash screen 5 times on completion. Every visible state still needs
+    # its own flush; the newline goes out with the first FLASH and the
+    # last UNFLASH goes out with the message.
+    sys.stdout.write(RESET + "\n")
+    for i in range(5):
         sys.stdout.write(FLASH)
         sys.stdout.flush()
         time.sleep(0.15)
         sys.stdout.write(UNFLASH)
-        sys.stdout.flush()
-        time.sleep(0.15)
-    print("Time's up!")
+        if i < 4:
+            sys.stdout.flush()
+            time.sleep(0.15)
+    sys.stdout.write("Time's up!\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 """Agent configurations and activation logic."""
 
-import re
 from dataclasses import dataclass, field
 
-from .models import AgentConfig, Message
+# Mention parsing lives with Message (which caches it)
+from .models import AgentConfig, Message, extract_mentions
 from .config import DEFAULT_ENDPOINT, DEFAULT_MODEL
 from .sandbox import Sandbox
 
@@ -23,17 +23,32 @@ class Room:
     agents: list[AgentConfig]
     messages: list[Message] = field(default_factory=list)
     sandbox: Sandbox | None = None
-
-
-def extract_mentions(content: str) -> list[str]:
-    """
-    Extract @mentions that request a response (with ?).
-    "@code?" → triggers response
-    "@code" → just a reference, no trigger
-    """
-    pattern = r'@(\w+)\?'
-    matches = re.findall(pattern, content)
-    return [f"@{m}" for m in matches]
+    # Lookup indexes over agents, kept in sync by add_agent()
+    agents_by_id: dict[str, AgentConfig] = field(init=False, repr=False)
+    agent_id_set: frozenset[str] = field(init=False, repr=False)
+    # from_id -> index of that participant's latest message in messages
+    last_msg_index: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.agents_by_id = {a.id: a for a in self.agents}
+        self.agent_id_set = frozenset(self.agents_by_id)
+        self.last_msg_index = {m.from_id: i for i, m in enumerate(self.messages)}
+
+    def add_message(self, msg: Message):
+        """Append a message to the conversation."""
+        self.messages.append(msg)
+        self.last_msg_index[msg.from_id] = len(self.messages) - 1
+
+    def clear_messages(self):
+        """Drop the conversation history."""
+        self.messages.clear()
+        self.last_msg_index.clear()
+
+    def add_agent(self, agent: AgentConfig):
+        """Add an agent to the room."""
+        self.agents.append(agent)
+        self.agents_by_id[agent.id] = agent
+        self.agent_id_set = frozenset(self.agents_by_id)
 
 
 def is_mentioned(agent_id: str, content: str) -> bool:
@@ -41,17 +56,22 @@ def is_mentioned(agent_id: str, content: str) -> bool:
     return agent_id in extract_mentions(content)
 
 
-def get_last_message_from(agent_id: str, messages: list[Message]) -> Message | None:
+def get_last_message_from(agent_id: str, room: Room) -> Message | None:
     """Get the most recent message from a specific agent."""
-    for msg in reversed(messages):
-        if msg.from_id == agent_id:
-            return msg
-    return None
+    idx = room.last_msg_index.get(agent_id)
+    return room.messages[idx] if idx is not None else None
 
 
-def get_agent_ids(room: Room) -> set[str]:
+def get_agent_ids(room: Room) -> frozenset[str]:
     """Get all agent IDs in the room."""
-    return {a.id for a in room.agents}
+    return room.agent_id_set
+
+
+def _addressed_agents(message: Message, room: Room) -> frozenset[str]:
+    """Agents in the room that a message explicitly @mentions (besides its sender)."""
+    if not message.mentions:
+        return frozenset()
+    return (message.mentions - {message.from_id}) & room.agent_id_set
 
 
 def should_wake(agent: AgentConfig, message: Message, room: Room) -> bool:
@@ -60,10 +80,9 @@ def should_wake(agent: AgentConfig, message: Message, room: Room) -> bool:
     if message.from_id == agent.id:
         return False
 
-    # Check if message explicitly @mentions any agents
-    mentions = set(extract_mentions(message.content))
-    mentions.discard(message.from_id)  # Ignore self-mentions
-    agent_mentions = mentions & get_agent_ids(room)  # Only mentions that are actual agents
+    # Check if message explicitly @mentions any agents (ignoring self-mentions
+    # and mentions that aren't actual agents)
+    agent_mentions = _addressed_agents(message, room)
 
     # If specific agents are mentioned, ONLY those agents respond
     # This lets user bypass "always" agents by directly addressing someone
@@ -71,13 +90,10 @@ def should_wake(agent: AgentConfig, message: Message, room: Room) -> bool:
         return agent.id in agent_mentions
 
     # "Awaiting response" - if I mentioned the speaker in my last message,
-    # I'm interested in their reply (but ignore self-mentions)
-    my_last_msg = get_last_message_from(agent.id, room.messages)
-    if my_last_msg:
-        my_mentions = set(extract_mentions(my_last_msg.content))
-        my_mentions.discard(agent.id)  # Ignore if I mentioned myself
-        if message.from_id in my_mentions:
-            return True
+    # I'm interested in their reply (self-mentions can't match, own messages returned above)
+    my_last_msg = get_last_message_from(agent.id, room)
+    if my_last_msg and message.from_id in my_last_msg.mentions:
+        return True
 
     # No specific mentions - check activation mode
     if agent.activation == "always":
@@ -89,8 +105,12 @@ def should_wake(agent: AgentConfig, message: Message, room: Room) -> bool:
 
 def find_initiator(msg: Message, room: Room) -> str | None:
     """Find who @mentioned the speaker, triggering this response."""
-    for prev_msg in reversed(room.messages[:-1]):
-        if msg.from_id in extract_mentions(prev_msg.content):
+    # Walk back from the message before this one, without copying the history
+    for i in range(len(room.messages) - 2, -1, -1):
+        prev_msg = room.messages[i]
+        # Cheap substring test first: most messages have no mentions at all,
+        # and this also avoids parsing (and caching) mentions for them
+        if "@" in prev_msg.content and msg.from_id in prev_msg.mentions:
             return prev_msg.from_id
         if prev_msg.from_id == msg.from_id:
             # Hit speaker's previous message, stop looking
@@ -98,18 +118,13 @@ def find_initiator(msg: Message, room: Room) -> str | None:
     return None
 
 
-def mentions_user(content: str) -> bool:
-    """Check if content mentions @user."""
-    return "@user" in content.lower()
-
-
 def next_recipient(completed_msg: Message, room: Room, exclude: set[str] | None = None) -> str | None:
     """After a message completes, who should respond next?"""
     exclude = exclude or set()
-    debug(f"next_recipient: from={completed_msg.from_id}, mentions={extract_mentions(completed_msg.content)}, exclude={exclude}")
+    debug(f"next_recipient: from={completed_msg.from_id}, mentions={sorted(completed_msg.mentions)}, exclude={exclude}")
 
     # 0. If the message mentions @user, wait for user input
-    if completed_msg.from_id != "@user" and mentions_user(completed_msg.content):
+    if completed_msg.from_id != "@user" and completed_msg.mentions_user:
         debug("→ pausing for @user")
         return None  # Pause for user
 
@@ -119,8 +134,11 @@ def next_recipient(completed_msg: Message, room: Room, exclude: set[str] | None
         debug(f"→ initiator: {initiator}")
         return initiator
 
-    # 2. Check if any agent wants to wake
-    for agent in room.agents:
+    # 2. Check if any agent wants to wake - if the message addresses specific
+    # agents, only they can (see should_wake), so don't bother with the rest
+    addressed = _addressed_agents(completed_msg, room)
+    candidates = [a for a in room.agents if a.id in addressed] if addressed else room.agents
+    for agent in candidates:
         if agent.id in exclude:
             debug(f"should_wake({agent.id}): skipped (passed)")
             continue
@@ -136,10 +154,7 @@ def next_recipient(completed_msg: Message, room: Room, exclude: set[str] | None
 
 def get_agent(agent_id: str, room: Room) -> AgentConfig | None:
     """Get an agent by ID."""
-    for agent in room.agents:
-        if agent.id == agent_id:
-            return agent
-    return None
+    return room.agents_by_id.get(agent_id)
 
 
 # Default agent configurations
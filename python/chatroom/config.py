@@ -17,6 +17,8 @@ DEFAULT_MODEL = "glm-4.7:cloud"
 SANDBOX_TIMEOUT = 30  # seconds
 SANDBOX_IMAGE = "mac-sandbox:latest"
 SANDBOX_DOCKERFILE_DIR = "./sandbox"
+# Bind-mount the workspace instead of copying it in (agents then edit host files)
+SANDBOX_BIND_MOUNT = False
 
 # Context settings
 MAX_CONTEXT_MESSAGES = 50
@@ -33,6 +33,23 @@ TOOLS = [
 ]
 
 
+# One client per (endpoint, api_key), so the HTTP connection pool is
+# reused across turns instead of reconnecting for every response
+_clients: dict[tuple[str, str], OpenAI] = {}
+
+
+def get_client(agent: AgentConfig) -> OpenAI:
+    """Get the (shared) OpenAI client for an agent's endpoint."""
+    key = (agent.endpoint, agent.api_key or "")
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = OpenAI(
+            base_url=agent.endpoint,
+            api_key=agent.api_key or "dummy"
+        )
+    return client
+
+
 def summarize_lines(text: str, max_lines: int = 3) -> str:
     """Summarize text to first N lines."""
     lines = text.strip().split('\n')
@@ -67,56 +84,71 @@ def format_tool_calls(msg: Message, level: str) -> str:
     return "\n\n".join(tool_parts)
 
 
+def _own_message_context(msg: Message) -> list[dict]:
+    """Build the "assistant" view of a message, for the agent that sent it."""
+    # Always show full tool context for own calls
+    if not msg.tool_calls:
+        # Simple assistant message
+        return [{"role": "assistant", "content": msg.content}]
+
+    context = []
+    for i, tc in enumerate(msg.tool_calls):
+        # Assistant message requesting tool call
+        context.append({
+            "role": "assistant",
+            "content": msg.content if i == 0 else None,
+            "tool_calls": [{
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {
+                    "name": tc.name,
+                    "arguments": tc.args_json
+                }
+            }]
+        })
+        # Tool result
+        result = msg.tool_results[i] if i < len(msg.tool_results) else ""
+        context.append({
+            "role": "tool",
+            "tool_call_id": f"call_{i}",
+            "content": result
+        })
+    return context
+
+
+def _other_message_context(msg: Message, level: str) -> list[dict]:
+    """Build the "user" view of another participant's message."""
+    # Strip @ from name for the name field
+    name = msg.from_id.lstrip("@")
+    content = msg.content
+
+    # Add tool call summary based on agent's tool_context setting
+    if msg.tool_calls and level != "none":
+        tool_summary = format_tool_calls(msg, level)
+        if tool_summary:
+            content += "\n\n" + tool_summary
+
+    return [{"role": "user", "name": name, "content": content}]
+
+
 def build_context(agent: AgentConfig, messages: list[Message]) -> list[dict]:
     """Build OpenAI-compatible message list for an agent."""
     context = [{"role": "system", "content": agent.system_prompt}]
 
-    # Take last N messages
-    recent = messages[-MAX_CONTEXT_MESSAGES:]
-
-    for msg in recent:
-        # Strip @ from name for the name field
-        name = msg.from_id.lstrip("@")
-
-        if msg.from_id == agent.id:
-            # My own messages are "assistant" - always show full tool context for own calls
-            if msg.tool_calls:
-                # Add assistant message with tool calls
-                for i, tc in enumerate(msg.tool_calls):
-                    # Assistant message requesting tool call
-                    context.append({
-                        "role": "assistant",
-                        "content": msg.content if i == 0 else None,
-                        "tool_calls": [{
-                            "id": f"call_{i}",
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.args)
-                            }
-                        }]
-                    })
-                    # Tool result
-                    result = msg.tool_results[i] if i < len(msg.tool_results) else ""
-                    context.append({
-                        "role": "tool",
-                        "tool_call_id": f"call_{i}",
-                        "content": result
-                    })
+    # Take last N messages (by index, without copying the tail)
+    for i in range(max(0, len(messages) - MAX_CONTEXT_MESSAGES), len(messages)):
+        msg = messages[i]
+        # A message renders the same for every agent sharing a viewpoint,
+        # so it's serialized once and reused on later turns
+        view = "self" if msg.from_id == agent.id else agent.tool_context
+        cached = msg.context_cache.get(view)
+        if cached is None:
+            if view == "self":
+                cached = _own_message_context(msg)
             else:
-                # Simple assistant message
-                context.append({"role": "assistant", "content": msg.content})
-        else:
-            # Other participants use "user" role with "name" field
-            content = msg.content
-
-            # Add tool call summary based on agent's tool_context setting
-            if msg.tool_calls:
-                tool_summary = format_tool_calls(msg, agent.tool_context)
-                if tool_summary:
-                    content += "\n\n" + tool_summary
-
-            context.append({"role": "user", "name": name, "content": content})
+                cached = _other_message_context(msg, view)
+            msg.context_cache[view] = cached
+        context.extend(cached)
 
     return context
 
@@ -126,12 +158,9 @@ def get_agent_response(agent: AgentConfig, room: Room) -> Message:
     messages = build_context(agent, room.messages)
     all_tool_calls: list[ToolCall] = []
     all_tool_results: list[str] = []
-    full_content = ""
+    full_parts: list[str] = []
 
-    client = OpenAI(
-        base_url=agent.endpoint,
-        api_key=agent.api_key or "dummy"
-    )
+    client = get_client(agent)
 
     first_response = True
     max_iterations = 10
@@ -162,7 +191,7 @@ def get_agent_response(agent: AgentConfig, room: Room) -> Message:
             )
 
         # Collect streamed response
-        collected_content = ""
+        collected_parts: list[str] = []
         collected_tool_calls = []
         current_tool_call = None
         finish_reason = None
@@ -184,21 +213,23 @@ def get_agent_response(agent: AgentConfig, room: Room) -> Message:
 
             # Handle content tokens
             if delta.content:
-                bytes_received += len(delta.content)
                 if first_response:
                     ui.clear_thinking()
                     ui.print_agent_label(agent.id)
                     first_response = False
                 ui.print_streaming_token(delta.content)
-                collected_content += delta.content
+                collected_parts.append(delta.content)
 
             # Handle tool calls (streamed in chunks)
             if delta.tool_calls:
-                # Update byte counter while building tool calls
-                for tc in delta.tool_calls:
-                    if tc.function and tc.function.arguments:
-                        bytes_received += len(tc.function.arguments)
+                # Don't leave buffered text hanging while the call streams in
+                ui.flush_stream()
+                # Update byte counter while building tool calls (only shown
+                # until the first content token replaces the indicator)
                 if first_response:
+                    for tc in delta.tool_calls:
+                        if tc.function and tc.function.arguments:
+                            bytes_received += len(tc.function.arguments)
                     ui.update_thinking_bytes(bytes_received)
                 for tc_chunk in delta.tool_calls:
                     if tc_chunk.index is not None:
@@ -220,8 +251,7 @@ def get_agent_response(agent: AgentConfig, room: Room) -> Message:
                             current_tool_call["arguments"] += tc_chunk.function.arguments
 
         # Add collected content
-        if collected_content:
-            full_content += collected_content
+        full_parts.extend(collected_parts)
 
         # If no tool calls, or finish_reason indicates stop, we're done
         if not collected_tool_calls or finish_reason in ("stop", "end_turn"):
@@ -274,18 +304,20 @@ def get_agent_response(agent: AgentConfig, room: Room) -> Message:
             })
 
         # Show we're waiting for next LLM response
+        ui.flush_stream()
         print(f"  {ui.DIM}...{ui.RESET}", flush=True)
 
     if iteration >= max_iterations:
         ui.print_error(f"Max iterations ({max_iterations}) reached")
 
     # End with newline
+    ui.flush_stream()
     print()
 
     return Message(
         id=str(uuid4()),
         from_id=agent.id,
-        content=full_content,
+        content="".join(full_parts),
         tool_calls=all_tool_calls,
         tool_results=all_tool_results,
     )
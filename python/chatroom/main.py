@@ -27,13 +27,13 @@ def main_loop(room: Room):
             break
 
         if user_input == "/clear":
-            room.messages.clear()
+            room.clear_messages()
             ui.print_system("Conversation cleared")
             continue
 
         # Add user message
         user_msg = Message.create("@user", user_input)
-        room.messages.append(user_msg)
+        room.add_message(user_msg)
 
         # Agent loop - keep going until it's the user's turn again
         current_msg = user_msg
@@ -65,7 +65,7 @@ def main_loop(room: Room):
 
             # Agent responded - clear passed set for new context
             passed_agents.clear()
-            room.messages.append(response)
+            room.add_message(response)
             current_msg = response
 
 
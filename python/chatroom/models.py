@@ -1,16 +1,41 @@
 """Data classes for the multi-agent chatroom."""
 
+import json
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 
+# "@name?" - a mention that requests a response
+MENTION_RE = re.compile(r'@(\w+)\?')
+# Any reference to @user (case-insensitive) hands the floor back to the human
+USER_MENTION_RE = re.compile(r'@user', re.IGNORECASE)
+
+
+def extract_mentions(content: str) -> list[str]:
+    """
+    Extract @mentions that request a response (with ?).
+    "@code?" → triggers response
+    "@code" → just a reference, no trigger
+    """
+    return ['@' + m for m in MENTION_RE.findall(content)]
+
+
+def mentions_user(content: str) -> bool:
+    """Check if content mentions @user."""
+    return USER_MENTION_RE.search(content) is not None
+
 
 @dataclass
 class ToolCall:
     """A tool invocation made by an agent."""
     name: str  # "bash"
     args: dict  # {"cmd": "..."}
+    args_json: str = field(init=False, repr=False)  # args serialized once for the API
+
+    def __post_init__(self):
+        self.args_json = json.dumps(self.args)
 
 
 @dataclass
@@ -22,6 +47,26 @@ class Message:
     tool_calls: list[ToolCall] = field(default_factory=list)
     tool_results: list[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
+    # Parsed mention info, filled in on first access of .mentions / .mentions_user
+    _mentions: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _mentions_user: bool | None = field(default=None, init=False, repr=False, compare=False)
+    # OpenAI-format dicts for this message, keyed by viewpoint ("self" or a
+    # tool_context level) - filled in by llm.build_context
+    context_cache: dict[str, list[dict]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def mentions(self) -> frozenset[str]:
+        """Agent IDs this message @mentions with a "?" (cached)."""
+        if self._mentions is None:
+            self._mentions = frozenset(extract_mentions(self.content))
+        return self._mentions
+
+    @property
+    def mentions_user(self) -> bool:
+        """Whether this message mentions @user (cached)."""
+        if self._mentions_user is None:
+            self._mentions_user = mentions_user(self.content)
+        return self._mentions_user
 
     @classmethod
     def create(cls, from_id: str, content: str) -> "Message":
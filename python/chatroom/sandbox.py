@@ -1,30 +1,42 @@
 """Docker-based sandbox for executing bash commands safely."""
 
+import os
+import queue
+import shlex
 import subprocess
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from uuid import uuid4
 
-from .config import SANDBOX_IMAGE, SANDBOX_TIMEOUT, SANDBOX_DOCKERFILE_DIR
+from .config import SANDBOX_BIND_MOUNT, SANDBOX_IMAGE, SANDBOX_TIMEOUT, SANDBOX_DOCKERFILE_DIR
 from . import ui
 
+# Touched next to the Dockerfile once the image is known to be current; its
+# mtime stands in for the image creation time so launches skip `docker inspect`
+IMAGE_SENTINEL = ".sandbox_image_built_at"
+
+# Set once the image has been checked (or built) in this process
+_image_checked = False
+# Whether that check trusted the sentinel without asking Docker
+_image_from_sentinel = False
+
 
 def get_image_created_time() -> datetime | None:
     """Get the creation time of the Docker image."""
     result = subprocess.run(
         ["docker", "inspect", "-f", "{{.Created}}", SANDBOX_IMAGE],
-        capture_output=True
+        capture_output=True,
+        text=True,
     )
     if result.returncode != 0:
         return None
 
     # Parse ISO format: 2024-01-15T10:30:00.123456789Z
-    created_str = result.stdout.decode().strip()
+    # Whole seconds are plenty to compare against the Dockerfile mtime
+    created_str = result.stdout.strip().split(".")[0].replace("Z", "")
     try:
-        # Handle nanoseconds by truncating to microseconds
-        if "." in created_str:
-            base, frac = created_str.replace("Z", "").split(".")
-            frac = frac[:6]  # Keep only microseconds
-            created_str = f"{base}.{frac}"
         return datetime.fromisoformat(created_str)
     except ValueError:
         return None
@@ -38,16 +50,50 @@ def get_dockerfile_modified_time() -> datetime | None:
     return datetime.fromtimestamp(dockerfile.stat().st_mtime)
 
 
+def _mark_image_current(dockerfile_dir: Path):
+    """Record that the image matches the Dockerfile."""
+    try:
+        (dockerfile_dir / IMAGE_SENTINEL).touch()
+    except OSError:
+        pass  # Read-only checkout - we'll just inspect again next launch
+
+
+def _forget_image_check():
+    """Drop the sentinel and cached check so the next ensure asks Docker."""
+    global _image_checked, _image_from_sentinel
+    _image_checked = False
+    _image_from_sentinel = False
+    try:
+        (Path(SANDBOX_DOCKERFILE_DIR) / IMAGE_SENTINEL).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def ensure_image_exists():
     """Build the sandbox image if it doesn't exist or Dockerfile changed."""
+    global _image_checked, _image_from_sentinel
+    if _image_checked:
+        return
+
     dockerfile_dir = Path(SANDBOX_DOCKERFILE_DIR)
     if not dockerfile_dir.exists():
         ui.print_error(f"Dockerfile directory not found: {SANDBOX_DOCKERFILE_DIR}")
         return
 
-    image_time = get_image_created_time()
     dockerfile_time = get_dockerfile_modified_time()
 
+    # Sentinel newer than the Dockerfile - no need to ask the Docker daemon
+    sentinel = dockerfile_dir / IMAGE_SENTINEL
+    if sentinel.exists() and (
+        dockerfile_time is None
+        or datetime.fromtimestamp(sentinel.stat().st_mtime) >= dockerfile_time
+    ):
+        _image_checked = True
+        _image_from_sentinel = True
+        return
+
+    image_time = get_image_created_time()
+
     needs_build = False
     if image_time is None:
         ui.print_system(f"Building sandbox image ({SANDBOX_IMAGE})...")
@@ -57,6 +103,8 @@ def ensure_image_exists():
         needs_build = True
 
     if not needs_build:
+        _mark_image_current(dockerfile_dir)
+        _image_checked = True
         return
 
     result = subprocess.run(
@@ -65,64 +113,151 @@ def ensure_image_exists():
     )
     if result.returncode == 0:
         ui.print_system("Sandbox image ready")
+        _mark_image_current(dockerfile_dir)
+        _image_checked = True
     else:
         ui.print_error(f"Failed to build image: {result.stderr.decode()}")
 
 
+def _has_entries(path: str) -> bool:
+    """Check whether a directory exists and is non-empty."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+def _pump_output(stream, chunks: queue.Queue):
+    """Forward output from a pipe into a queue in chunks, then None at EOF."""
+    while chunk := stream.read1(65536):
+        chunks.put(chunk)
+    chunks.put(None)
+
+
 class Sandbox:
     """Docker-based sandbox for executing bash commands safely."""
 
     def __init__(self, workspace_dir: str | None = None):
         self.container_id: str | None = None
         self.workspace_dir = workspace_dir
+        # Long-lived `docker exec -i bash` that commands are piped into,
+        # so each tool call doesn't pay for a new docker exec
+        self._shell: subprocess.Popen | None = None
+        self._shell_output: queue.Queue | None = None
 
     def start(self):
         """Start the sandbox container."""
         ensure_image_exists()
 
+        mount = SANDBOX_BIND_MOUNT and self.workspace_dir and Path(self.workspace_dir).is_dir()
+
         cmd = [
             "docker", "run", "-d", "--rm",
             "-w", "/workspace",
-            SANDBOX_IMAGE,
-            "sleep", "infinity"
         ]
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        if mount:
+            cmd += ["-v", f"{Path(self.workspace_dir).resolve()}:/workspace"]
+        cmd += [SANDBOX_IMAGE, "sleep", "infinity"]
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError:
+            if not _image_from_sentinel:
+                raise
+            # The sentinel vouched for an image Docker doesn't have (removed,
+            # pruned, other daemon) - check properly, rebuild, and retry once
+            _forget_image_check()
+            ensure_image_exists()
+            result = subprocess.run(cmd, capture_output=True, check=True)
         self.container_id = result.stdout.decode().strip()
         ui.print_system(f"Sandbox started ({self.container_id[:12]})")
 
-        # Copy workspace if provided
-        if self.workspace_dir and Path(self.workspace_dir).exists():
+        # Copy workspace if provided (nothing to copy if mounted or empty)
+        if not mount and self.workspace_dir and _has_entries(self.workspace_dir):
             subprocess.run([
                 "docker", "cp",
                 f"{self.workspace_dir}/.",
                 f"{self.container_id}:/workspace/"
             ], check=True)
 
+        self._start_shell()
+
+    def _start_shell(self):
+        """Start the persistent shell session in the container."""
+        self._shell = subprocess.Popen(
+            ["docker", "exec", "-i", self.container_id, "bash"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        self._shell_output = queue.Queue()
+        threading.Thread(
+            target=_pump_output,
+            args=(self._shell.stdout, self._shell_output),
+            daemon=True,
+        ).start()
+
+    def _stop_shell(self):
+        """Kill the shell session (a fresh one is started on next execute)."""
+        if self._shell:
+            self._shell.kill()
+            self._shell.wait()
+            self._shell = None
+            self._shell_output = None
+
     def execute(self, cmd: str, timeout: int = SANDBOX_TIMEOUT) -> str:
         """Execute a bash command and return output."""
         if not self.container_id:
             return "[ERROR: Sandbox not started]"
 
         try:
-            result = subprocess.run(
-                ["docker", "exec", self.container_id, "bash", "-c", cmd],
-                capture_output=True,
-                timeout=timeout
+            if self._shell is None or self._shell.poll() is not None:
+                self._start_shell()
+
+            # Each command gets its own `bash -c` (same semantics as a one-off
+            # docker exec: fresh cwd/env, no stdin), then prints a unique
+            # marker so we know where its output ends. Piping through cat
+            # holds the marker back until every writer (including background
+            # jobs) has closed the output, like waiting for EOF used to
+            marker = f"__OFC_DONE_{uuid4().hex}__"
+            self._shell.stdin.write(
+                f"bash -c {shlex.quote(cmd)} </dev/null 2>&1 | cat\n"
+                f"printf '\\n{marker}\\n'\n".encode()
             )
-            output = result.stdout.decode() + result.stderr.decode()
+            self._shell.stdin.flush()
+
+            raw = bytearray()
+            deadline = time.monotonic() + timeout
+            end = f"\n{marker}\n".encode()
+            while True:
+                try:
+                    chunk = self._shell_output.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._stop_shell()
+                    return f"[ERROR: Command timed out after {timeout}s]"
+                if chunk is None:
+                    self._stop_shell()
+                    return "[ERROR: Sandbox shell exited]"
+                # Only rescan the tail the marker could straddle
+                start = max(0, len(raw) - len(end) + 1)
+                raw += chunk
+                idx = raw.find(end, start)
+                if idx != -1:
+                    del raw[idx:]
+                    break
 
-            # Truncate very long output
-            if len(output) > 10000:
-                output = output[:5000] + "\n... [truncated] ...\n" + output[-2000:]
+            # Truncate very long output - on bytes, so only the kept slices get decoded
+            if len(raw) > 10000:
+                raw = b"".join([raw[:5000], b"\n... [truncated] ...\n", raw[-2000:]])
 
-            return output.strip() if output.strip() else "[no output]"
-        except subprocess.TimeoutExpired:
-            return f"[ERROR: Command timed out after {timeout}s]"
+            output = raw.decode(errors="replace").strip()
+            return output or "[no output]"
         except Exception as e:
             return f"[ERROR: {e}]"
 
     def stop(self):
         """Stop and remove the container."""
+        self._stop_shell()
         if self.container_id:
             subprocess.run(
                 ["docker", "kill", self.container_id],
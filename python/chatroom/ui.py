@@ -1,6 +1,8 @@
 """Terminal UI helpers with colors and formatting."""
 
 import sys
+import time
+from types import MappingProxyType
 
 # ANSI color codes
 RESET = "\033[0m"
@@ -16,13 +18,30 @@ MAGENTA = "\033[35m"
 CYAN = "\033[36m"
 WHITE = "\033[37m"
 
-# Agent colors (consistent per agent)
-AGENT_COLORS = {
+# Prebuilt bytes for the hot paths, written straight to the binary stdout
+_CLEAR_LINE_B = b"\r\033[K"
+_THINKING_B = f"{DIM}thinking...{RESET}".encode()
+_RECEIVING_B = f"{DIM}receiving... ".encode()
+_RESET_B = RESET.encode()
+
+
+def _write_b(buf: bytes):
+    """Write bytes to stdout, skipping the text layer's encode step."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(buf.decode())
+        return
+    sys.stdout.flush()  # Push pending text-layer writes first to keep ordering
+    out.write(buf)
+
+
+# Agent colors (consistent per agent, read-only)
+AGENT_COLORS = MappingProxyType({
     "@user": CYAN,
     "@data": MAGENTA,
     "@code": GREEN,
     "@reviewer": YELLOW,
-}
+})
 
 
 def get_agent_color(agent_id: str) -> str:
@@ -30,63 +49,120 @@ def get_agent_color(agent_id: str) -> str:
     return AGENT_COLORS.get(agent_id, WHITE)
 
 
+def agent_label(agent_id: str) -> str:
+    """Build a styled agent label like [@data]:"""
+    return f"{BOLD}{get_agent_color(agent_id)}[{agent_id}]:{RESET} "
+
+
 def print_agent_label(agent_id: str, end: str = ""):
     """Print a styled agent label like [@data]:"""
-    color = get_agent_color(agent_id)
-    sys.stdout.write(f"{BOLD}{color}[{agent_id}]:{RESET} {end}")
+    drain_stream()
+    sys.stdout.write(agent_label(agent_id) + end)
     sys.stdout.flush()
 
 
+# Streamed tokens are batched here instead of one write per token, and go
+# out on a newline, once the buffer is big, or after a short interval
+STREAM_FLUSH_BYTES = 4096
+STREAM_FLUSH_INTERVAL = 0.05  # seconds
+_stream_buf: list[str] = []
+_stream_bytes = 0
+_stream_last_flush = 0.0
+
+
+def drain_stream():
+    """Write out any buffered streaming tokens (without flushing)."""
+    global _stream_bytes
+    if _stream_buf:
+        # Encode the whole batch once, rather than per token in the text layer
+        _write_b("".join(_stream_buf).encode(sys.stdout.encoding or "utf-8", "replace"))
+        _stream_buf.clear()
+        _stream_bytes = 0
+
+
+def flush_stream():
+    """Write out buffered streaming tokens and flush stdout."""
+    global _stream_last_flush
+    drain_stream()
+    sys.stdout.flush()
+    _stream_last_flush = time.monotonic()
+
+
 def print_streaming_token(token: str):
     """Print a token during streaming."""
-    sys.stdout.write(token)
-    sys.stdout.flush()
+    global _stream_bytes
+    _stream_buf.append(token)
+    _stream_bytes += len(token)
+    if (
+        "\n" in token
+        or _stream_bytes > STREAM_FLUSH_BYTES
+        or time.monotonic() - _stream_last_flush >= STREAM_FLUSH_INTERVAL
+    ):
+        flush_stream()
 
 
 def print_tool_call(cmd: str):
     """Print a tool call being executed."""
-    print(f"\n  {DIM}${RESET} {BOLD}{cmd}{RESET}")
+    drain_stream()
+    sys.stdout.write(f"\n  {DIM}${RESET} {BOLD}{cmd}{RESET}\n")
 
 
 def print_tool_result(result: str, max_lines: int = 15):
     """Print tool result with truncation."""
+    drain_stream()
     lines = result.split('\n')
+    # Build the whole block so it goes out in one write
+    out = f"  {DIM}" + "\n  ".join(lines[:max_lines]) + f"{RESET}\n"
     if len(lines) > max_lines:
-        shown = lines[:max_lines]
-        print(f"  {DIM}" + f"\n  ".join(shown) + f"{RESET}")
-        print(f"  {DIM}... ({len(lines) - max_lines} more lines){RESET}")
-    else:
-        print(f"  {DIM}" + f"\n  ".join(lines) + f"{RESET}")
+        out += f"  {DIM}... ({len(lines) - max_lines} more lines){RESET}\n"
+    sys.stdout.write(out)
+
+
+# update_thinking_bytes only redraws once the count has grown this much
+THINKING_REDRAW_BYTES = 256
+_thinking_painted = -THINKING_REDRAW_BYTES  # count last drawn (first update always draws)
 
 
 def print_thinking():
     """Print thinking indicator."""
-    sys.stdout.write(f"{DIM}thinking...{RESET}")
+    global _thinking_painted
+    drain_stream()
+    _thinking_painted = -THINKING_REDRAW_BYTES
+    _write_b(_THINKING_B)
     sys.stdout.flush()
 
 
 def update_thinking_bytes(byte_count: int):
     """Update thinking indicator with byte count."""
+    global _thinking_painted
+    if byte_count - _thinking_painted < THINKING_REDRAW_BYTES:
+        return
+    _thinking_painted = byte_count
+    drain_stream()
     if byte_count < 1024:
         size_str = f"{byte_count}b"
     else:
-        size_str = f"{byte_count / 1024:.1f}kb"
-    sys.stdout.write(f"\r\033[K{DIM}receiving... {size_str}{RESET}")
+        kb10 = (byte_count * 10) >> 10  # tenths of a kb, truncated
+        size_str = f"{kb10 // 10}.{kb10 % 10}kb"
+    _write_b(_CLEAR_LINE_B + _RECEIVING_B + size_str.encode() + _RESET_B)
     sys.stdout.flush()
 
 
 def clear_thinking():
     """Clear the thinking indicator."""
+    drain_stream()
     # Move back and clear
-    sys.stdout.write("\r\033[K")
+    _write_b(_CLEAR_LINE_B)
     sys.stdout.flush()
 
 
 def print_system(msg: str):
     """Print a system message."""
-    print(f"{DIM}[System]: {msg}{RESET}")
+    drain_stream()
+    sys.stdout.write(f"{DIM}[System]: {msg}{RESET}\n")
 
 
 def print_error(msg: str):
     """Print an error message."""
-    print(f"{RED}{BOLD}[Error]: {msg}{RESET}")
+    drain_stream()
+    sys.stdout.write(f"{RED}{BOLD}[Error]: {msg}{RESET}\n")
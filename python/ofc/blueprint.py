@@ -1,16 +1,48 @@
 """Blueprint loading and parsing."""
 
+import copy
+import functools
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 # Reuse existing models
 from chatroom.models import AgentConfig
 
 
-@dataclass
+# Top-level keys that make up a blueprint's header (see Blueprint.read_header)
+_HEADER_KEYS = {b"name", b"description", b"defaults"}
+_TOP_LEVEL_KEY_RE = re.compile(rb"^([A-Za-z_][\w-]*)\s*:")
+
+
+def _parse_yaml(raw: bytes) -> Any:
+    """Parse YAML bytes with the fastest available safe loader."""
+    # Imported here so code that only builds blueprints from dicts never loads yaml
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(abs_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a blueprint file. mtime/size are part of the cache key, so edits invalidate it."""
+    # Hand libyaml the raw bytes - it does the UTF-8 decoding itself
+    with open(abs_path, "rb") as f:
+        return _parse_yaml(f.read())
+
+
+def _load(path: Path) -> dict:
+    """Load a blueprint file's data (cached until the file changes)."""
+    st = os.stat(path)
+    # Copy so callers can't mutate the cached parse (e.g. via .defaults)
+    return copy.deepcopy(_load_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size))
+
+
+@dataclass(frozen=True, slots=True)
 class WorkstationConfig:
     """Configuration for a workstation (MCP)."""
     type: str  # "sandbox", "filesystem", etc.
@@ -22,7 +54,7 @@ class WorkstationConfig:
     path: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Blueprint:
     """A complete floor configuration."""
     name: str
@@ -30,14 +62,51 @@ class Blueprint:
     agents: list[AgentConfig]
     workstations: list[WorkstationConfig]
     defaults: dict[str, Any] = field(default_factory=dict)
+    # First "sandbox" workstation, if any (resolved once, used by Floor)
+    sandbox_workstation: WorkstationConfig | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so bypass the dataclass __setattr__ guard for this derived field
+        object.__setattr__(self, "sandbox_workstation", next(
+            (ws for ws in self.workstations if ws.type == "sandbox"), None
+        ))
 
     @classmethod
     def from_file(cls, path: str | Path) -> "Blueprint":
         """Load a blueprint from a YAML file."""
         path = Path(path)
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls.from_dict(data, base_path=path.parent)
+        return cls.from_dict(_load(path), base_path=path.parent)
+
+    @staticmethod
+    def read_header(path: str | Path) -> dict[str, str]:
+        """Read just a blueprint's name and description, without parsing the rest.
+
+        Only the lines up to the first top-level key other than name,
+        description or defaults are parsed; if that slice isn't valid YAML
+        on its own (or lacks name or description, which may come later in
+        the file), the whole file is loaded instead.
+        """
+        import yaml  # Only for the error type; already loaded by _parse_yaml
+
+        head = []
+        with open(path, "rb") as f:
+            for line in f:
+                key = _TOP_LEVEL_KEY_RE.match(line)
+                if key and key.group(1) not in _HEADER_KEYS:
+                    break
+                head.append(line)
+
+        try:
+            data = _parse_yaml(b"".join(head))
+            if not isinstance(data, dict) or not {"name", "description"} <= data.keys():
+                raise ValueError("incomplete blueprint header")
+        except (yaml.YAMLError, ValueError):
+            data = _load(Path(path))
+
+        return {
+            "name": data.get("name", "unnamed"),
+            "description": data.get("description", ""),
+        }
 
     @classmethod
     def from_dict(cls, data: dict, base_path: Path | None = None) -> "Blueprint":
@@ -47,33 +116,33 @@ class Blueprint:
         default_model = defaults.get("model", "llama3")
 
         # Parse agents
-        agents = []
-        for agent_data in data.get("agents", []):
-            agent = AgentConfig(
-                id=agent_data["id"],
-                model=agent_data.get("model", default_model),
-                endpoint=agent_data.get("endpoint", default_endpoint),
-                api_key=agent_data.get("api_key"),
-                system_prompt=agent_data.get("prompt", ""),
-                activation=agent_data.get("activation", "mention"),
-                can_use_tools=agent_data.get("can_use_tools", False),
-                temperature=agent_data.get("temperature", 0.7),
-                tool_context=agent_data.get("tool_context", "full"),
+        agents = [
+            AgentConfig(
+                id=a["id"],
+                model=a.get("model", default_model),
+                endpoint=a.get("endpoint", default_endpoint),
+                api_key=a.get("api_key"),
+                system_prompt=a.get("prompt", ""),
+                activation=a.get("activation", "mention"),
+                can_use_tools=a.get("can_use_tools", False),
+                temperature=a.get("temperature", 0.7),
+                tool_context=a.get("tool_context", "full"),
             )
-            agents.append(agent)
+            for a in data.get("agents", ())
+        ]
 
         # Parse workstations
-        workstations = []
-        for ws_data in data.get("workstations", []):
-            ws = WorkstationConfig(
-                type=ws_data.get("type", "sandbox"),
-                name=ws_data.get("name", "default"),
-                image=ws_data.get("image"),
-                dockerfile=ws_data.get("dockerfile"),
-                mount=ws_data.get("mount"),
-                path=ws_data.get("path"),
+        workstations = [
+            WorkstationConfig(
+                type=ws.get("type", "sandbox"),
+                name=ws.get("name", "default"),
+                image=ws.get("image"),
+                dockerfile=ws.get("dockerfile"),
+                mount=ws.get("mount"),
+                path=ws.get("path"),
             )
-            workstations.append(ws)
+            for ws in data.get("workstations", ())
+        ]
 
         return cls(
             name=data.get("name", "unnamed"),
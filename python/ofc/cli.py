@@ -6,7 +6,35 @@ import sys
 from pathlib import Path
 
 from . import __version__
-from .floor import run_blueprint
+
+
+# Starter blueprint written by `ofc init` (__NAME__ is replaced with the name)
+_TEMPLATE = b'''# OFC Blueprint - __NAME__
+# Run with: ofc run
+
+name: __NAME__
+description: "Describe your floor here"
+
+defaults:
+  endpoint: http://localhost:11434/v1
+  model: llama3
+
+agents:
+  - id: "@assistant"
+    name: "Assistant"
+    activation: always
+    can_use_tools: true
+    temperature: 0.7
+    prompt: |
+      You are a helpful assistant.
+      Keep responses concise and helpful.
+
+workstations:
+  - type: sandbox
+    name: python-sandbox
+    image: python:3.11-slim
+    mount: ./workspace:/workspace
+'''
 
 
 def main():
@@ -60,6 +88,8 @@ def main():
             print(f"Error: Blueprint not found: {blueprint_path}")
             print(f"Create one with: ofc init")
             sys.exit(1)
+        # Imported here so --version/init don't pay for yaml, openai, etc.
+        from .floor import run_blueprint
         run_blueprint(str(blueprint_path), initial_prompt=args.prompt, debug=args.debug)
 
     elif args.command == "init":
@@ -76,34 +106,8 @@ def create_blueprint(name: str):
         print(f"Error: {filename} already exists")
         sys.exit(1)
 
-    template = f'''# OFC Blueprint - {name}
-# Run with: ofc run
-
-name: {name}
-description: "Describe your floor here"
-
-defaults:
-  endpoint: http://localhost:11434/v1
-  model: llama3
-
-agents:
-  - id: "@assistant"
-    name: "Assistant"
-    activation: always
-    can_use_tools: true
-    temperature: 0.7
-    prompt: |
-      You are a helpful assistant.
-      Keep responses concise and helpful.
-
-workstations:
-  - type: sandbox
-    name: python-sandbox
-    image: python:3.11-slim
-    mount: ./workspace:/workspace
-'''
-    with open(filename, "w") as f:
-        f.write(template)
+    with open(filename, "wb") as f:
+        f.write(_TEMPLATE.replace(b"__NAME__", name.encode("utf-8")))
 
     print(f"Created {filename}")
     print(f"Run with: ofc run")
@@ -1,5 +1,7 @@
 """Floor - the runtime for a blueprint."""
 
+import re
+import sys
 from pathlib import Path
 
 from chatroom.models import Message
@@ -10,6 +12,9 @@ from chatroom import ui
 
 from .blueprint import Blueprint, load_blueprint
 
+# An agent declining its turn (case-insensitive, anywhere in the response)
+_PASS_RE = re.compile(r"\[pass\]", re.IGNORECASE)
+
 
 class Floor:
     """A running floor instance."""
@@ -19,23 +24,16 @@ class Floor:
         self.workspace_dir = workspace_dir
         self.sandbox: Sandbox | None = None
         self.room: Room | None = None
+        self._labels: dict[str, str] = {}
+        self._banner = ""
 
     def __enter__(self):
         """Start the floor (initialize sandbox, etc.)."""
-        # Find sandbox workstation config
-        sandbox_config = None
-        for ws in self.blueprint.workstations:
-            if ws.type == "sandbox":
-                sandbox_config = ws
-                break
+        sandbox_config = self.blueprint.sandbox_workstation
 
         if sandbox_config:
             # Parse mount if present (format: "./local:/container")
-            workspace = self.workspace_dir
-            if sandbox_config.mount:
-                parts = sandbox_config.mount.split(":")
-                if parts:
-                    workspace = parts[0]
+            workspace = (sandbox_config.mount or "").partition(":")[0] or self.workspace_dir
 
             # Note: Sandbox currently uses config-level constants for dockerfile
             # TODO: Allow passing dockerfile_dir to Sandbox
@@ -43,9 +41,27 @@ class Floor:
             self.sandbox.__enter__()
 
         self.room = Room(
-            agents=self.blueprint.agents,
+            agents=list(self.blueprint.agents),  # Room may add agents; keep the blueprint intact
             sandbox=self.sandbox,
         )
+
+        # Styled labels/banner are fixed for the floor's lifetime, build them once
+        bp = self.blueprint
+        self._labels = {a.id: ui.agent_label(a.id) for a in bp.agents}
+        self._labels["@user"] = ui.agent_label("@user")
+        agents_list = ", ".join(ui.get_agent_color(a.id) + a.id + ui.RESET for a in bp.agents)
+        banner = [
+            f"{ui.BOLD}{'=' * 50}{ui.RESET}",
+            f"{ui.BOLD}OFC - {bp.name}{ui.RESET}",
+        ]
+        if bp.description:
+            banner.append(f"{ui.DIM}{bp.description}{ui.RESET}")
+        banner += [
+            f"Agents: {agents_list}",
+            f"Type {ui.BOLD}/quit{ui.RESET} to exit, {ui.BOLD}/clear{ui.RESET} to reset",
+            f"{ui.BOLD}{'=' * 50}{ui.RESET}",
+        ]
+        self._banner = "\n".join(banner) + "\n"
         return self
 
     def __exit__(self, *args):
@@ -55,31 +71,31 @@ class Floor:
 
     def run(self, initial_prompt: str | None = None):
         """Run the interactive floor loop."""
-        bp = self.blueprint
-
-        print(f"{ui.BOLD}{'=' * 50}{ui.RESET}")
-        print(f"{ui.BOLD}OFC - {bp.name}{ui.RESET}")
-        if bp.description:
-            print(f"{ui.DIM}{bp.description}{ui.RESET}")
-        print(f"Agents: {', '.join(ui.get_agent_color(a.id) + a.id + ui.RESET for a in bp.agents)}")
-        print(f"Type {ui.BOLD}/quit{ui.RESET} to exit, {ui.BOLD}/clear{ui.RESET} to reset")
-        print(f"{ui.BOLD}{'=' * 50}{ui.RESET}")
+        sys.stdout.write(self._banner)
+        sys.stdout.flush()
 
         self._main_loop(initial_prompt=initial_prompt)
 
         print(f"\n{ui.DIM}Goodbye! ofc. 🎤{ui.RESET}")
 
+    def _print_label(self, agent_id: str):
+        """Print a prebuilt agent label."""
+        ui.drain_stream()  # Keep the label behind any buffered tokens
+        sys.stdout.write(self._labels[agent_id])
+        sys.stdout.flush()
+
     def _main_loop(self, initial_prompt: str | None = None):
         """Main conversation loop."""
         one_shot = initial_prompt is not None
         first_iteration = True
+        passed_agents: set[str] = set()  # Who passed this turn, reused across turns
 
         while True:
             # Handle initial prompt on first iteration
             if first_iteration and initial_prompt:
                 user_input = initial_prompt
                 print()
-                ui.print_agent_label("@user")
+                self._print_label("@user")
                 print(user_input)
                 first_iteration = False
             else:
@@ -89,7 +105,7 @@ class Floor:
 
                 try:
                     print()
-                    ui.print_agent_label("@user")
+                    self._print_label("@user")
                     user_input = input().strip()
                 except (EOFError, KeyboardInterrupt):
                     ui.print_system("Interrupted")
@@ -98,21 +114,19 @@ class Floor:
             if not user_input:
                 continue
 
-            if user_input == "/quit":
-                break
-
-            if user_input == "/clear":
-                self.room.messages.clear()
-                ui.print_system("Conversation cleared")
+            handler = _COMMANDS.get(user_input)
+            if handler:
+                if handler(self):
+                    break
                 continue
 
             # Add user message
             user_msg = Message.create("@user", user_input)
-            self.room.messages.append(user_msg)
+            self.room.add_message(user_msg)
 
             # Agent loop
             current_msg = user_msg
-            passed_agents: set[str] = set()
+            passed_agents.clear()
 
             while True:
                 next_agent_id = next_recipient(current_msg, self.room, exclude=passed_agents)
@@ -126,20 +140,39 @@ class Floor:
                     break
 
                 print()
-                ui.print_agent_label(agent.id)
+                self._print_label(agent.id)
                 ui.print_thinking()
 
                 response = get_agent_response(agent, self.room)
 
-                if "[pass]" in response.content.strip().lower():
+                if _PASS_RE.search(response.content):
                     passed_agents.add(agent.id)
                     continue
 
                 passed_agents.clear()
-                self.room.messages.append(response)
+                self.room.add_message(response)
                 current_msg = response
 
 
+def _cmd_quit(floor: Floor) -> bool:
+    """End the session."""
+    return True
+
+
+def _cmd_clear(floor: Floor) -> bool:
+    """Reset the conversation."""
+    floor.room.clear_messages()
+    ui.print_system("Conversation cleared")
+    return False
+
+
+# Slash commands - a handler returns True to end the session
+_COMMANDS = {
+    "/quit": _cmd_quit,
+    "/clear": _cmd_clear,
+}
+
+
 def run_blueprint(path: str = "blueprint.yaml", initial_prompt: str | None = None, debug: bool = False):
     """Load and run a blueprint."""
     # Set debug mode in agents module